@@ -1,313 +1,749 @@
+import asyncio
 import threading
 import time
 import json
 import os
-import pandas as pd
+import shutil
+from collections import deque
+from itertools import islice
 import dash
-from dash import dcc, html, Input, Output, State, callback
+from dash import dcc, html, Input, Output, State, Patch, callback
 import plotly.graph_objs as go
 from flask import Flask, redirect, url_for, request, session, flash
 import webbrowser
 import numpy as np
 import psutil  # Added psutil for real system monitoring
 
+try:
+    from numba import njit  # Optional: compiles the Banker's safety loop to native code
+except ImportError:
+    njit = None
+
+try:
+    import orjson  # Optional: much faster JSON encoding for the state file and log lines
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: serve through an ASGI server instead of Flask's development server
+    import uvicorn
+    from a2wsgi import WSGIMiddleware
+except ImportError:
+    uvicorn = None
+
+try:
+    from fastrlock.rlock import FastRLock as RLock  # C implementation, noticeably cheaper to acquire
+except ImportError:
+    from threading import RLock
+
 # Global Variables
-mutex = threading.Lock()
+# mutex guards allocation/max_claim; it is re-entrant so is_safe_state can take it
+# from inside request_resource. logs have their own lock so logging never waits on it.
+mutex = RLock()
+_log_lock = threading.Lock()
+# The managed resource types, in the fixed order used by every array and table
+RESOURCE_NAMES = ("CPU", "Memory", "Disk", "Network")
+RESOURCE_OPTIONS = [{'label': res, 'value': res} for res in RESOURCE_NAMES]
 # Instead of fixed resources, we'll dynamically get them
 resources = {
     "CPU": 0,  # Will be updated with real CPU availability
-    "Memory": 0,  # Will be updated with real memory availability in GB
-    "Disk": 0,  # Will be updated with real disk space in GB
+    "Memory": 0,  # Will be updated with real memory availability
+    "Disk": 0,  # Will be updated with real disk space
     "Network": 0  # Will be updated with network bandwidth estimation
 }
+# Utilisation percentages from the same probe, for the usage graphs
+system_usage = {"CPU": 0.0, "Memory": 0.0, "Disk": 0.0, "Network": 0.0}
+# Amounts are accounted as integers so sums and comparisons are exact:
+# CPU in centi-cores, Memory and Disk in MB, Network in bandwidth units.
+# Divide by the scale to get the unit shown to users (cores, GB, units).
+SCALE = {"CPU": 100, "Memory": 1024, "Disk": 1024, "Network": 1}
+_SCALE_ARR = np.array([SCALE[res] for res in RESOURCE_NAMES], dtype=np.float64)  # SCALE in RESOURCE_NAMES order
+# Availability below these amounts (cores, GB, GB, units) raises a critical alert
+CRITICAL_LOW = {"CPU": 0.5, "Memory": 1.0, "Disk": 5.0, "Network": 10.0}
+_CRITICAL_LOW_ARR = np.array([CRITICAL_LOW[res] for res in RESOURCE_NAMES]) * _SCALE_ARR  # In stored units
+# Amount granted or released per click: 0.1 cores, 0.5 GB RAM, 1 GB disk, 5 network units
+ALLOCATION_AMOUNTS = {"CPU": 10, "Memory": 512, "Disk": 1024, "Network": 5}
+DEFAULT_ALLOCATION_AMOUNT = 10
 users = {"admin": "admin123", "User1": "pass1", "User2": "pass2", "User3": "pass3"}
-allocation = {user: {res: 0 for res in resources} for user in users}
-max_claim = {user: {res: 0 for res in resources} for user in users}  # Max resources each user might claim
-logs = []
+# Row/column positions of users and resources in the state arrays
+USER_NAMES = tuple(users)
+USER_IDX = {user: i for i, user in enumerate(USER_NAMES)}
+RES_IDX = {res: i for i, res in enumerate(RESOURCE_NAMES)}
+allocation = {user: {res: 0 for res in RESOURCE_NAMES} for user in users}
+max_claim = {user: {res: 0 for res in RESOURCE_NAMES} for user in users}  # Max resources each user might claim
+total_allocated = {res: 0 for res in RESOURCE_NAMES}  # Running sum of allocation over users, per resource
+MAX_LOG_ENTRIES = 500
+logs = deque(maxlen=MAX_LOG_ENTRIES)  # Only the most recent entries are kept in memory; the log file has the rest
 dashboard_server_running = False
+app_initialized = False
+_startup_lock = threading.Lock()
+
+# Bumped on every allocation/max_claim mutation; derived data is cached against it
+_state_version = 0
+
+# NumPy (users x resources) views of allocation/max_claim for the Banker's Algorithm.
+# The dicts stay authoritative; the arrays are rebuilt lazily when the version moves.
+_arrays_version = -1
+_alloc_arr = None
+_max_claim_arr = None
+_need_arr = None
+
+# Last Banker's result as (state version, available resources, (is_safe, safe_sequence))
+_safety_cache = (None, None, None)
+
+# Resource sample seen by the previous system_monitor tick, for change detection
+_last_resources_arr = None
 
 # Ensure data directory exists
 os.makedirs("data", exist_ok=True)
 STATE_FILE = "data/resource_state.json"
-LOG_FILE = "data/resource_logs.json"
+LOG_FILE = "data/resource_logs.jsonl"  # Append-only, one JSON-encoded entry per line
+LEGACY_LOG_FILE = "data/resource_logs.json"  # Older versions kept the whole log as one JSON array
 MAX_CLAIM_FILE = "data/max_claim.json"
+# Previous versions of the state files, newest in slot 0
+BACKUP_DIR = "data/backups"
+BACKUP_COUNT = 5
+BACKUP_INTERVAL = 60.0  # Seconds between backup rotations, so the slots span minutes rather than a burst of writes
+_last_backup_ts = None
+os.makedirs(BACKUP_DIR, exist_ok=True)
+
+# Only system_monitor (and startup) probe psutil. Each probe builds fresh dicts and
+# publishes them by rebinding the globals, so readers never need a lock and request
+# paths never pay for a probe. Probes closer together than this reuse the last sample.
+PROBE_MIN_INTERVAL = 1.0
+DISK_PATH = '/'
+# Machine totals do not change while the process runs, so they are read once
+_CPU_COUNT = psutil.cpu_count(logical=True)
+_TOTAL_MEM_GB = psutil.virtual_memory().total / (1024 ** 3)
+_TOTAL_DISK_GB = psutil.disk_usage(DISK_PATH).total / (1024 ** 3)
+# Interfaces counted for network load (up, not loopback) and their combined link capacity
+_NET_STATS = psutil.net_if_stats()
+_NET_NICS = tuple(name for name, stats in _NET_STATS.items() if stats.isup and "loopback" not in stats.flags)
+DEFAULT_LINK_MBPS = 100  # Assumed when the OS reports no link speed (common for virtual NICs)
+_NET_CAPACITY_BPS = (sum(_NET_STATS[nic].speed for nic in _NET_NICS) or DEFAULT_LINK_MBPS) * 1_000_000 / 8
+_last_net_sample = None  # (monotonic time, bytes sent + received) at the previous probe
+# The same totals in stored units, in RESOURCE_NAMES order; Network is scored out of 100
+_RES_TOTALS = np.array([_CPU_COUNT * SCALE["CPU"], _TOTAL_MEM_GB * SCALE["Memory"],
+                        _TOTAL_DISK_GB * SCALE["Disk"], 100 * SCALE["Network"]])
+# Percentage points per stored unit, so usage is 100 - available * _USAGE_SCALE
+_USAGE_SCALE = 100.0 / _RES_TOTALS
+_last_probe_ts = 0.0
+_probe_lock = threading.Lock()
+
+# save_state() sets _state_dirty; state_writer then waits SAVE_DEBOUNCE so a burst of
+# mutations is written as one snapshot, off the request thread
+SAVE_DEBOUNCE = 0.5
+_state_dirty = threading.Event()
+_state_write_lock = threading.Lock()  # Serializes snapshot + write, so writes land in snapshot order; taken before mutex
+_log_file = None
+_log_seq = 0  # Incremented whenever logs change, so views can tell they are stale
+LOG_ROTATE_BYTES = 10 * 1024 * 1024  # Roll LOG_FILE over to LOG_FILE.1 past this size
+
+# Exponential moving average of CPU utilisation, fed only by sample_cpu()
+CPU_EMA_WEIGHT = 0.3  # Weight of the newest sample
+CPU_SEED_INTERVAL = 0.1  # Length of the one blocking sample that seeds the average
+_cpu_ema = None
+
+def sample_cpu():
+    """Fold the CPU utilisation since the previous sample into the moving average"""
+    global _cpu_ema
+    if _cpu_ema is None:
+        # A non-blocking sample taken right after import would only measure the import
+        # itself (close to 100%), so seed from one short blocking sample instead. This
+        # also primes psutil, so later non-blocking calls cover the time since this one.
+        _cpu_ema = psutil.cpu_percent(interval=CPU_SEED_INTERVAL)
+    else:
+        current = psutil.cpu_percent(interval=None)
+        _cpu_ema = (1 - CPU_EMA_WEIGHT) * _cpu_ema + CPU_EMA_WEIGHT * current
+    return _cpu_ema
 
 # Function to update system resources using psutil
 def update_system_resources():
-    # CPU availability (number of logical cores - load)
-    cpu_percent = psutil.cpu_percent(interval=0.1)
-    cpu_count = psutil.cpu_count(logical=True)
-    resources["CPU"] = max(0.1, cpu_count * (100 - cpu_percent) / 100)  # Scaled to represent available CPU power
+    global _last_probe_ts, resources, system_usage
+    with _probe_lock:
+        now = time.monotonic()
+        if now - _last_probe_ts < PROBE_MIN_INTERVAL:
+            return resources
+        _last_probe_ts = now
+        resources, system_usage = _probe_system_resources()
+    return resources
+
+def _probe_system_resources():
+    global _last_net_sample
+    new_resources = {}
+    
+    # CPU availability (number of logical cores - load), from the smoothed utilisation
+    cpu_percent = _cpu_ema if _cpu_ema is not None else sample_cpu()
+    new_resources["CPU"] = max(10, round(_CPU_COUNT * (100 - cpu_percent)))  # Available CPU power in centi-cores
     
-    # Memory availability in GB
+    # Memory availability in MB
     memory = psutil.virtual_memory()
-    resources["Memory"] = round(memory.available / (1024 ** 3), 2)  # Available memory in GB
+    new_resources["Memory"] = memory.available // (1024 ** 2)  # Available memory in MB
     
-    # Disk space in GB (using root path)
-    disk = psutil.disk_usage('/')
-    resources["Disk"] = round(disk.free / (1024 ** 3), 2)  # Free disk space in GB
+    # Disk space in MB (using root path)
+    disk = psutil.disk_usage(DISK_PATH)
+    new_resources["Disk"] = disk.free // (1024 ** 2)  # Free disk space in MB
     
-    # Network bandwidth estimation (simplified)
-    # This is a rough approximation, as actual bandwidth measurement requires more complex tracking
-    net_io = psutil.net_io_counters()
-    resources["Network"] = round(100 - (net_io.bytes_sent + net_io.bytes_recv) % 100, 2)  # Simplified network availability
+    # Network availability: the share of link capacity left unused since the previous probe
+    now = time.monotonic()
+    counters = psutil.net_io_counters(pernic=True)
+    net_bytes = sum(counters[nic].bytes_sent + counters[nic].bytes_recv for nic in _NET_NICS if nic in counters)
+    load = 0.0
+    if _last_net_sample is not None:
+        last_ts, last_bytes = _last_net_sample
+        elapsed = now - last_ts
+        if elapsed > 0:
+            # Counters can reset (e.g. an interface restart), so clamp to [0, 1]
+            load = min(1.0, max(0.0, (net_bytes - last_bytes) / (elapsed * _NET_CAPACITY_BPS)))
+    _last_net_sample = (now, net_bytes)
+    new_resources["Network"] = round(100 * (1 - load))  # Percent of bandwidth available
     
-    return resources
+    usage = {"CPU": cpu_percent, "Memory": memory.percent, "Disk": disk.percent,
+             "Network": 100 - new_resources["Network"]}  # Network load (simplified)
+    return new_resources, usage
+
+def to_display(res, value):
+    """Convert an integer amount of a resource to the unit shown to users"""
+    return value / SCALE[res]
+
+def from_display(res, value):
+    """Convert an amount in the unit shown to users to integer units"""
+    return int(round(value * SCALE[res]))
+
+def _from_stored(table):
+    # State files written before integer accounting hold floats in display units
+    return {user: {res: from_display(res, value) if isinstance(value, float) else value
+                   for res, value in amounts.items()}
+            for user, amounts in table.items()}
 
 # Load previous state
 def load_state():
-    global allocation, logs, max_claim
+    global allocation, max_claim
     try:
         if os.path.exists(STATE_FILE):
-            with open(STATE_FILE, "r") as f:
-                data = json.load(f)
-                allocation = data.get("allocation", allocation)
-        
-        if os.path.exists(LOG_FILE):
-            with open(LOG_FILE, "r") as f:
-                logs = json.load(f)
+            with open(STATE_FILE, "rb") as f:
+                data = _loads(f.read())
+                allocation = _from_stored(data.get("allocation", allocation))
+        recompute_total_allocated()
         
         if os.path.exists(MAX_CLAIM_FILE):
-            with open(MAX_CLAIM_FILE, "r") as f:
-                max_claim = json.load(f)
+            with open(MAX_CLAIM_FILE, "rb") as f:
+                max_claim = _from_stored(_loads(f.read()))
         else:
             # Initialize max claims with reasonable defaults based on available resources
             update_system_resources()  # Get current system resources
             for user in users:
-                for res in resources:
+                for res in RESOURCE_NAMES:
                     # Set max claim to 70% of total resource by default
-                    total_resource = resources[res] + sum(allocation[u][res] for u in users)
-                    max_claim[user][res] = total_resource * 0.7
+                    total_resource = resources[res] + total_allocated[res]
+                    max_claim[user][res] = int(total_resource * 0.7)
     except Exception as e:
         print(f"Error loading state: {e}")
         # Continue with default values if there's an error
-
-def save_state():
+    mark_state_changed()
+    
+    # Logs are loaded separately, so a damaged log file never keeps the state files from loading
     try:
-        with open(STATE_FILE, "w") as f:
-            json.dump({"allocation": allocation}, f, indent=2)
+        if not os.path.exists(LOG_FILE) and os.path.exists(LEGACY_LOG_FILE):
+            migrate_legacy_logs()
         
-        with open(LOG_FILE, "w") as f:
-            json.dump(logs, f, indent=2)
-        
-        with open(MAX_CLAIM_FILE, "w") as f:
-            json.dump(max_claim, f, indent=2)
+        if os.path.exists(LOG_FILE):
+            # Refill in place so every holder of the logs deque sees the loaded entries
+            with _log_lock:
+                logs.clear()
+                logs.extend(read_log_entries(LOG_FILE))
     except Exception as e:
-        print(f"Error saving state: {e}")
+        print(f"Error loading logs: {e}")
+
+def _dumps(obj):
+    """Serialize obj to compact JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(",", ":"), default=_numpy_to_json).encode()
+
+def _numpy_to_json(obj):
+    # Lets the stdlib fallback accept the NumPy values orjson serializes natively
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _loads(data):
+    """Parse JSON from bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def read_log_entries(path):
+    """Yield log entries from an append-only JSON-lines log file, skipping damaged lines"""
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                try:
+                    yield _loads(line)
+                except ValueError:
+                    # e.g. a last line torn by a crash mid-write
+                    continue
+
+def migrate_legacy_logs():
+    """Copy the entries of the old JSON-array log into LOG_FILE; runs until LOG_FILE exists"""
+    with open(LEGACY_LOG_FILE, "rb") as f:
+        entries = _loads(f.read())
+    # Write the whole history before LOG_FILE appears, so an interrupted run is simply redone
+    tmp_path = LOG_FILE + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"".join(_dumps(entry) + b"\n" for entry in entries))
+    os.replace(tmp_path, LOG_FILE)
+
+def _write_json_atomic(path, data, backup=False):
+    # Write to a temporary file first so a crash never leaves a truncated file behind
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_dumps(data))
+        f.flush()
+        os.fsync(f.fileno())  # The data must be on disk before the rename makes it current
+    if backup and os.path.exists(path):
+        _rotate_backups(path)
+    os.replace(tmp_path, path)
+
+def _rotate_backups(path):
+    """Shift path's backups down one slot and copy the current file into slot 0"""
+    name, ext = os.path.splitext(os.path.basename(path))
+    slots = [os.path.join(BACKUP_DIR, f"{name}.{i}{ext}") for i in range(BACKUP_COUNT)]
+    for i in range(BACKUP_COUNT - 1, 0, -1):
+        if os.path.exists(slots[i - 1]):
+            os.replace(slots[i - 1], slots[i])
+    # Copy rather than move, so path exists at every moment until the replace
+    shutil.copyfile(path, slots[0])
+
+def write_state(backup=False):
+    """
+    Write the allocation/max_claim snapshot to disk immediately. Backups are
+    rotated when backup is set or BACKUP_INTERVAL has passed since the last rotation.
+    """
+    global _last_backup_ts
+    # Snapshot and write under the write lock (always taken before mutex), so concurrent
+    # writers finish in snapshot order and the last one to write has the newest state
+    with _state_write_lock:
+        with mutex:
+            # Cleared under the mutex, so a mutation after this snapshot marks it dirty again
+            _state_dirty.clear()
+            allocation_snapshot = {user: dict(allocation[user]) for user in allocation}
+            max_claim_snapshot = {user: dict(max_claim[user]) for user in max_claim}
+        try:
+            now = time.monotonic()
+            if _last_backup_ts is None or now - _last_backup_ts >= BACKUP_INTERVAL:
+                backup = True
+            if backup:
+                _last_backup_ts = now
+            _write_json_atomic(STATE_FILE, {"allocation": allocation_snapshot}, backup)
+            _write_json_atomic(MAX_CLAIM_FILE, max_claim_snapshot, backup)
+        except Exception as e:
+            print(f"Error saving state: {e}")
+
+def recompute_total_allocated():
+    """Rebuild the running per-resource totals from the allocation dicts"""
+    global total_allocated
+    total_allocated = {res: sum(allocation[user][res] for user in USER_NAMES) for res in RESOURCE_NAMES}
+
+def save_state():
+    # Only mark the snapshot dirty; state_writer coalesces the actual disk writes
+    _state_dirty.set()
+
+def state_writer():
+    """Thread function to flush dirty state to disk shortly after it changes"""
+    while True:
+        _state_dirty.wait()
+        time.sleep(SAVE_DEBOUNCE)
+        write_state()
+
+def flush_now():
+    """Write the current state and close the log file; used on shutdown"""
+    global _log_file
+    write_state(backup=True)  # Always keep the state as it was at shutdown
+    with _log_lock:
+        if _log_file is not None:
+            _log_file.close()
+            _log_file = None
+
+def _get_log_file():
+    global _log_file
+    if _log_file is None:
+        _log_file = open(LOG_FILE, "ab")
+    return _log_file
 
 def log_event(event):
+    global _log_seq, _log_file
     timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
     log_entry = f"{timestamp} - {event}"
-    logs.append(log_entry)
-    
-    # Save after each log to prevent data loss
-    with open(LOG_FILE, "w") as f:
-        json.dump(logs, f, indent=2)
-
-def check_resource_usage():
-    update_system_resources()  # Get latest resource values
-    alerts = []
-    for res, value in resources.items():
-        total_allocated = sum(allocation[user][res] for user in users)
-        total_available = value
-        usage_percentage = (total_allocated / (total_allocated + total_available)) * 100 if (total_allocated + total_available) > 0 else 0
+    with _log_lock:
+        logs.append(log_entry)
+        _log_seq += 1
         
-        if usage_percentage > 80:
-            alerts.append(f"{res} usage is high ({usage_percentage:.1f}%)")
+        # Append only the new entry so each log costs O(1) disk I/O
+        f = _get_log_file()
+        f.write(_dumps(log_entry) + b"\n")
+        f.flush()
         
-        if res == "CPU" and value < 0.5:
-            alerts.append(f"{res} availability is critically low!")
-        elif res == "Memory" and value < 1.0:
-            alerts.append(f"{res} availability is critically low!")
-        elif res == "Disk" and value < 5.0:
-            alerts.append(f"{res} availability is critically low!")
-        elif res == "Network" and value < 10.0:
+        # In append mode the position is the file size, so no extra stat call is needed
+        if f.tell() > LOG_ROTATE_BYTES:
+            f.close()
+            os.replace(LOG_FILE, LOG_FILE + ".1")
+            _log_file = None
+
+def recent_logs(count):
+    """Return the newest count log entries, oldest first, without copying the whole deque"""
+    # Iterating a deque while another thread appends raises, so read under the log lock
+    with _log_lock:
+        tail = list(islice(reversed(logs), count))
+    tail.reverse()
+    return tail
+
+def clear_logs():
+    global _log_file, _log_seq
+    with _log_lock:
+        logs.clear()
+        _log_seq += 1
+        if _log_file is not None:
+            _log_file.close()
+        _log_file = open(LOG_FILE, "wb")
+
+def check_resource_usage(snapshot=None):
+    """
+    Returns alert messages for high usage or critically low availability.
+    Callers that already hold a resources snapshot pass it in so the alerts
+    describe the same sample their decision was based on.
+    """
+    if snapshot is None:
+        snapshot = resources
+    available = _resources_array(snapshot)
+    allocated = np.fromiter((total_allocated[res] for res in RESOURCE_NAMES), dtype=np.int64, count=len(RESOURCE_NAMES))
+    
+    # Share of each resource held by users, and which resources are nearly exhausted
+    total = allocated + available
+    usage_percentage = np.divide(100.0 * allocated, total, out=np.zeros(len(RESOURCE_NAMES)), where=total > 0)
+    high = usage_percentage > 80
+    low = available < _CRITICAL_LOW_ARR
+    
+    alerts = []
+    for i in np.flatnonzero(high | low):
+        res = RESOURCE_NAMES[i]
+        if high[i]:
+            alerts.append(f"{res} usage is high ({usage_percentage[i]:.1f}%)")
+        if low[i]:
             alerts.append(f"{res} availability is critically low!")
     
     return alerts
 
 # ----------------- BANKER'S ALGORITHM IMPLEMENTATION -----------------
 
+def mark_state_changed():
+    """Record a mutation of allocation/max_claim, invalidating the arrays and safety cache"""
+    global _state_version
+    _state_version += 1
+
+def get_state_arrays():
+    """
+    Returns (alloc_arr, max_claim_arr, need_arr) as (users x resources) integer
+    arrays, rebuilding them from the allocation/max_claim dicts only when dirty.
+    """
+    global _arrays_version, _alloc_arr, _max_claim_arr, _need_arr
+    if _arrays_version != _state_version:
+        _alloc_arr = np.array([[allocation[user][res] for res in RESOURCE_NAMES] for user in USER_NAMES], dtype=np.int64)
+        _max_claim_arr = np.array([[max_claim[user][res] for res in RESOURCE_NAMES] for user in USER_NAMES], dtype=np.int64)
+        # Need matrix: maximum needs - current allocation, kept with the arrays it comes from
+        _need_arr = _max_claim_arr - _alloc_arr
+        _arrays_version = _state_version
+    return _alloc_arr, _max_claim_arr, _need_arr
+
+def _safe_order_numpy(alloc_arr, need, work):
+    """
+    Banker's safety loop using NumPy row comparisons.
+    Returns the indices of the users that can finish, in finishing order,
+    the same order _safe_order_kernel produces.
+    """
+    finish = np.zeros(len(need), dtype=bool)
+    order = []
+    
+    # Like the kernel, each pass walks the users in index order: after a user
+    # finishes, the search resumes after it rather than from the first user
+    start = 0
+    progress = False
+    while True:
+        candidates = np.flatnonzero(~finish[start:] & np.all(need[start:] <= work, axis=1))
+        if len(candidates) == 0:
+            if not progress:
+                break
+            # End of a pass that finished someone; start the next pass
+            start = 0
+            progress = False
+            continue
+        
+        idx = start + int(candidates[0])
+        work += alloc_arr[idx]
+        finish[idx] = True
+        order.append(idx)
+        start = idx + 1
+        progress = True
+    
+    return order
+
+KERNEL_MAX_USERS = 62  # The pending-user bitmask must fit in a positive int64
+
+def _safe_order_kernel(alloc_arr, need, work):
+    """
+    Banker's safety loop written as plain loops for Numba to compile.
+    Returns the indices of the users that can finish, in finishing order.
+    Supports up to KERNEL_MAX_USERS users.
+    """
+    n_users, n_res = need.shape
+    order = np.empty(n_users, dtype=np.int64)
+    count = 0
+    
+    # Bit i is set while user i has not finished, so each pass only walks up to
+    # the highest pending user and stops as soon as everyone has finished
+    pending = (1 << n_users) - 1
+    progress = True
+    while progress and pending:
+        progress = False
+        rest = pending
+        i = 0
+        while rest:
+            if rest & 1:
+                fits = True
+                for k in range(n_res):
+                    if need[i, k] > work[k]:
+                        fits = False
+                        break
+                if fits:
+                    for k in range(n_res):
+                        work[k] += alloc_arr[i, k]
+                    pending &= ~(1 << i)
+                    order[count] = i
+                    count += 1
+                    progress = True
+            rest >>= 1
+            i += 1
+    
+    return order[:count]
+
+if njit is not None:
+    _safe_order_kernel = njit(cache=True)(_safe_order_kernel)
+    # Compile now rather than on the first allocation request, on a case where only the
+    # second user fits first, and check the compiled loop agrees with the NumPy one
+    _check_alloc = np.array([[1], [5], [1]], dtype=np.int64)
+    _check_need = np.array([[3], [1], [3]], dtype=np.int64)
+    _check_work = np.array([1], dtype=np.int64)
+    assert list(_safe_order_kernel(_check_alloc, _check_need, _check_work.copy())) == \
+        _safe_order_numpy(_check_alloc, _check_need, _check_work.copy()) == [1, 2, 0]
+
 def is_safe_state():
     """
     Implements the Banker's Algorithm to check if the system is in a safe state.
     Returns a tuple: (is_safe, safe_sequence or None)
+    
+    The result is reused while neither the state version nor the available
+    resources have changed since the last run.
     """
-    update_system_resources()  # Get latest resource values
+    global _safety_cache
+    # The arrays are replaced rather than mutated on rebuild, so holding the
+    # references taken under the lock gives a consistent snapshot (as does resources)
+    with mutex:
+        version = _state_version
+        alloc_arr, _, need_arr = get_state_arrays()
+    available = resources
+    resources_key = tuple(available[res] for res in RESOURCE_NAMES)
     
-    # Create working copies of the resource vectors
-    work = {res: resources[res] for res in resources}
-    finish = {user: False for user in users}
+    cached_version, cached_resources_key, cached_result = _safety_cache
+    if cached_version == version and cached_resources_key == resources_key:
+        return cached_result
     
-    # Need vector: maximum needs - current allocation
-    need = {}
-    for user in users:
-        need[user] = {}
-        for res in resources:
-            need[user][res] = max_claim[user][res] - allocation[user][res]
+    result = _check_safety(alloc_arr, need_arr, resources_key)
+    _safety_cache = (version, resources_key, result)
+    return result
+
+def _check_safety(alloc_arr, need, resources_key):
+    """
+    Runs the Banker's safety check on the given allocation/need arrays
+    and available amounts. Returns a tuple: (is_safe, safe_sequence or None)
+    """
+    user_names = list(USER_NAMES)
     
-    # Find a safe sequence
-    safe_sequence = []
+    # Work vector starts at the currently available resources
+    work = np.array(resources_key, dtype=np.int64)
     
-    while True:
-        found = False
-        for user in users:
-            if not finish[user]:
-                # Check if all resource needs can be met
-                can_allocate = True
-                for res in resources:
-                    if need[user][res] > work[res]:
-                        can_allocate = False
-                        break
-                
-                if can_allocate:
-                    # This user's needs can be satisfied
-                    for res in resources:
-                        work[res] += allocation[user][res]
-                    finish[user] = True
-                    safe_sequence.append(user)
-                    found = True
-        
-        if not found:
-            break
+    # Cheap answers before the full simulation. Finishing a user only ever adds
+    # to work, so a user whose need fits now still fits after any others finish.
+    fits = np.all(need <= work, axis=1)
+    if fits.all():
+        # Everyone can finish right away, in order
+        return True, user_names
+    if not fits.any():
+        # Nobody can finish first, so no safe sequence exists
+        return False, None
+    if not alloc_arr.any():
+        # Nothing is allocated, so finishing never grows work and the rest never fit
+        return False, None
+    
+    # Find a safe sequence of user indices
+    if njit is not None and len(user_names) <= KERNEL_MAX_USERS:
+        order = _safe_order_kernel(alloc_arr, need, work)
+    else:
+        order = _safe_order_numpy(alloc_arr, need, work)
+    safe_sequence = [user_names[i] for i in order]
     
     # Check if all processes are finished
-    is_safe = all(finish.values())
+    is_safe = len(safe_sequence) == len(user_names)
     
-    return (is_safe, safe_sequence if is_safe else None)
+    return is_safe, safe_sequence if is_safe else None
 
 def request_resource(user, resource):
+    global _safety_cache
+    # Decide and mutate under the lock; logging and saving happen after it is released
     with mutex:
-        update_system_resources()  # Get latest resource values
-        
-        # Check if the resource is available
-        if resources[resource] <= 0:
-            log_event(f"{user} request denied: No {resource} units available!")
-            return False, f"No {resource} units available!"
+        available = resources  # One snapshot for the checks and the alerts below
         
-        # Calculate how much to allocate (scaled for different resource types)
-        allocation_amount = 0.1  # Default small amount
-        if resource == "CPU":
-            allocation_amount = 0.1  # CPU cores
-        elif resource == "Memory":
-            allocation_amount = 0.5  # 0.5 GB of RAM
-        elif resource == "Disk":
-            allocation_amount = 1.0  # 1 GB of disk
-        elif resource == "Network":
-            allocation_amount = 5.0  # 5 units of network bandwidth
+        allocation_amount = ALLOCATION_AMOUNTS.get(resource, DEFAULT_ALLOCATION_AMOUNT)
+        amount_shown = to_display(resource, allocation_amount)
         
-        # Check if resource has enough to allocate
-        if resources[resource] < allocation_amount:
-            message = f"Not enough {resource} available! (Needed: {allocation_amount}, Available: {resources[resource]:.2f})"
-            log_event(f"{user} request denied: {message}")
-            return False, message
-        
-        # Check if this request would exceed max claim
-        if allocation[user][resource] + allocation_amount > max_claim[user][resource]:
-            message = f"Request denied: Would exceed your maximum claim of {max_claim[user][resource]:.2f} for {resource}!"
-            log_event(f"{user} request denied: {message}")
-            return False, message
-        
-        # Temporarily allocate the resource to check safety
-        allocation[user][resource] += allocation_amount
-        
-        # Check if this allocation leads to a safe state
-        is_safe, safe_sequence = is_safe_state()
-        
-        if is_safe:
-            log_event(f"{user} allocated {allocation_amount} unit of {resource} - System is in safe state")
-            log_event(f"Safe sequence: {' -> '.join(safe_sequence)}")
+        is_safe = False
+        if available[resource] <= 0:
+            # Check if the resource is available
+            message = f"No {resource} units available!"
+        elif available[resource] < allocation_amount:
+            # Check if resource has enough to allocate
+            message = f"Not enough {resource} available! (Needed: {amount_shown}, Available: {to_display(resource, available[resource]):.2f})"
+        elif allocation[user][resource] + allocation_amount > max_claim[user][resource]:
+            # Check if this request would exceed max claim
+            message = f"Request denied: Would exceed your maximum claim of {to_display(resource, max_claim[user][resource]):.2f} for {resource}!"
+        else:
+            message = None
+            # Check the allocation on a candidate copy of the arrays, so the shared dicts
+            # only ever hold committed state and lock-free readers never see a tentative grant
+            alloc_arr, _, need_arr = get_state_arrays()
+            cell = USER_IDX[user], RES_IDX[resource]
+            candidate = alloc_arr.copy()
+            candidate[cell] += allocation_amount
+            candidate_need = need_arr.copy()
+            candidate_need[cell] -= allocation_amount
+            resources_key = tuple(available[res] for res in RESOURCE_NAMES)
             
-            # Check for alerts after allocation
-            alerts = check_resource_usage()
-            alert_message = ""
-            if alerts:
-                alert_message = "Alerts: " + ", ".join(alerts)
-                log_event(f"Resource alerts: {alert_message}")
+            # Check if this allocation leads to a safe state
+            is_safe, safe_sequence = _check_safety(candidate, candidate_need, resources_key)
             
-            save_state()
-            return True, f"Successfully allocated {allocation_amount} unit of {resource}" + (f". {alert_message}" if alert_message else "")
-        else:
-            # Revert the allocation as it would lead to an unsafe state
-            allocation[user][resource] -= allocation_amount
-            message = "Request denied: Granting this resource would lead to a potential deadlock!"
-            log_event(f"{user} denied {allocation_amount} unit of {resource} - Would lead to unsafe state")
-            return False, message
+            if is_safe:
+                allocation[user][resource] += allocation_amount
+                total_allocated[resource] += allocation_amount
+                mark_state_changed()
+                # The verdict just computed is the one for the new state
+                _safety_cache = (_state_version, resources_key, (is_safe, safe_sequence))
+    
+    if message is not None:
+        log_event(f"{user} request denied: {message}")
+        return False, message
+    
+    if is_safe:
+        log_event(f"{user} allocated {amount_shown} unit of {resource} - System is in safe state")
+        log_event(f"Safe sequence: {' -> '.join(safe_sequence)}")
+        
+        # Check for alerts after allocation
+        alerts = check_resource_usage(available)
+        alert_message = ""
+        if alerts:
+            alert_message = "Alerts: " + ", ".join(alerts)
+            log_event(f"Resource alerts: {alert_message}")
+        
+        save_state()
+        return True, f"Successfully allocated {amount_shown} unit of {resource}" + (f". {alert_message}" if alert_message else "")
+    else:
+        message = "Request denied: Granting this resource would lead to a potential deadlock!"
+        log_event(f"{user} denied {amount_shown} unit of {resource} - Would lead to unsafe state")
+        return False, message
 
 def release_resource(user, resource):
+    # Release the same amount a request grants
+    release_amount = ALLOCATION_AMOUNTS.get(resource, DEFAULT_ALLOCATION_AMOUNT)
+    amount_shown = to_display(resource, release_amount)
+    
     with mutex:
-        # Calculate how much to release (match request amounts)
-        release_amount = 0.1  # Default small amount
-        if resource == "CPU":
-            release_amount = 0.1  # CPU cores
-        elif resource == "Memory":
-            release_amount = 0.5  # 0.5 GB of RAM
-        elif resource == "Disk":
-            release_amount = 1.0  # 1 GB of disk
-        elif resource == "Network":
-            release_amount = 5.0  # 5 units of network bandwidth
-        
-        if allocation[user][resource] >= release_amount:
+        current = allocation[user][resource]
+        released = current >= release_amount
+        if released:
             allocation[user][resource] -= release_amount
-            log_event(f"{user} released {release_amount} unit of {resource}")
+            total_allocated[resource] -= release_amount
+            mark_state_changed()
             # After releasing, system is always in a safer state
             is_safe, safe_sequence = is_safe_state()
-            if is_safe:
-                log_event(f"System is in safe state after release. Safe sequence: {' -> '.join(safe_sequence)}")
-            save_state()
-            return True, f"Successfully released {release_amount} unit of {resource}"
-        else:
-            message = f"{user} has not allocated enough {resource}! (Has: {allocation[user][resource]:.2f}, Trying to release: {release_amount})"
-            log_event(message)
-            return False, message
+    
+    if released:
+        log_event(f"{user} released {amount_shown} unit of {resource}")
+        if is_safe:
+            log_event(f"System is in safe state after release. Safe sequence: {' -> '.join(safe_sequence)}")
+        save_state()
+        return True, f"Successfully released {amount_shown} unit of {resource}"
+    else:
+        message = f"{user} has not allocated enough {resource}! (Has: {to_display(resource, current):.2f}, Trying to release: {amount_shown})"
+        log_event(message)
+        return False, message
 
 def update_max_claim(user, resource, new_max):
+    try:
+        new_max = float(new_max)
+    except ValueError:
+        return False, "Invalid value. Please enter a number."
+    
     with mutex:
-        try:
-            new_max = float(new_max)
-            # Validate the new maximum claim
-            if new_max < allocation[user][resource]:
-                message = f"Maximum claim cannot be less than current allocation ({allocation[user][resource]:.2f})!"
-                log_event(f"{user} max claim update failed: {message}")
-                return False, message
-            
+        current = allocation[user][resource]
+        # Validate the new maximum claim
+        updated = from_display(resource, new_max) >= current
+        if updated:
             # Update the max claim
-            max_claim[user][resource] = new_max
-            log_event(f"{user}'s maximum claim for {resource} updated to {new_max}")
+            max_claim[user][resource] = from_display(resource, new_max)
+            mark_state_changed()
             
             # Check if the system is still in a safe state
             is_safe, safe_sequence = is_safe_state()
-            if is_safe:
-                log_event(f"System remains in safe state after max claim update. Safe sequence: {' -> '.join(safe_sequence)}")
-                save_state()
-                return True, f"Maximum claim for {resource} updated to {new_max}"
-            else:
-                # This shouldn't happen from just updating max claim if current allocation is valid
-                # but we'll check anyway
-                log_event(f"Warning: System is now in unsafe state after max claim update!")
-                save_state()
-                return True, f"Maximum claim updated, but system is now in an unsafe state! Consider releasing some resources."
-        except ValueError:
-            return False, "Invalid value. Please enter a number."
+    
+    if not updated:
+        message = f"Maximum claim cannot be less than current allocation ({to_display(resource, current):.2f})!"
+        log_event(f"{user} max claim update failed: {message}")
+        return False, message
+    
+    log_event(f"{user}'s maximum claim for {resource} updated to {new_max}")
+    save_state()
+    if is_safe:
+        log_event(f"System remains in safe state after max claim update. Safe sequence: {' -> '.join(safe_sequence)}")
+        return True, f"Maximum claim for {resource} updated to {new_max}"
+    else:
+        # This shouldn't happen from just updating max claim if current allocation is valid
+        # but we'll check anyway
+        log_event(f"Warning: System is now in unsafe state after max claim update!")
+        return True, f"Maximum claim updated, but system is now in an unsafe state! Consider releasing some resources."
+
+def _resources_array(snapshot):
+    return np.fromiter((snapshot[res] for res in RESOURCE_NAMES), dtype=np.int64, count=len(RESOURCE_NAMES))
 
 def system_monitor():
     """Thread function to continuously monitor system resources"""
+    global _last_resources_arr
+    _last_resources_arr = _resources_array(resources)
     while True:
         try:
             time.sleep(5)  # Update every 5 seconds
-            with mutex:
-                old_resources = resources.copy()
-                update_system_resources()
-                
-                # Log significant changes
-                for res in resources:
-                    if abs(resources[res] - old_resources[res]) > old_resources[res] * 0.1:  # 10% change
-                        log_event(f"System {res} changed from {old_resources[res]:.2f} to {resources[res]:.2f}")
-                
-                # Check if system is still in safe state after resource changes
-                is_safe, safe_sequence = is_safe_state()
-                if not is_safe:
-                    log_event("WARNING: System entered unsafe state due to resource changes!")
+            sample_cpu()
+            new_arr = _resources_array(update_system_resources())
+            
+            # Log significant changes (more than 10% of the previous sample)
+            old_arr = _last_resources_arr
+            changed = np.abs(new_arr - old_arr) > 0.1 * old_arr
+            for i in np.flatnonzero(changed):
+                res = RESOURCE_NAMES[i]
+                log_event(f"System {res} changed from {to_display(res, old_arr[i]):.2f} to {to_display(res, new_arr[i]):.2f}")
+            _last_resources_arr = new_arr
+            
+            # Check if system is still in safe state after resource changes
+            is_safe, safe_sequence = is_safe_state()
+            if not is_safe:
+                log_event("WARNING: System entered unsafe state due to resource changes!")
         except Exception as e:
             print(f"Error in system_monitor thread: {e}")
 
@@ -317,6 +753,29 @@ def system_monitor():
 server = Flask(__name__)
 server.secret_key = 'resource_manager_secret_key'  # For session management
 app = dash.Dash(__name__, server=server, url_base_pathname='/dashboard/')
+# The Flask app wrapped for ASGI servers. Each request runs on one of ASGI_WORKERS
+# threads, so callbacks from different tabs are served in parallel as under Flask.
+ASGI_WORKERS = 10
+_wsgi_asgi_app = WSGIMiddleware(server, workers=ASGI_WORKERS) if uvicorn is not None else None
+
+async def _asgi_with_lifespan(scope, receive, send):
+    # The WSGI adapter ignores lifespan events, so startup and shutdown are handled here
+    if scope["type"] != "lifespan":
+        await _wsgi_asgi_app(scope, receive, send)
+        return
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            # Both do blocking file I/O, so keep them off the event loop
+            await asyncio.to_thread(init_app)
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await asyncio.to_thread(flush_now)
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+# ASGI entry point (uvicorn res:asgi_app); runs init_app() on startup and flushes on shutdown
+asgi_app = _asgi_with_lifespan if uvicorn is not None else None
 
 # Define the layout for the Dash app
 app.layout = html.Div([
@@ -324,6 +783,82 @@ app.layout = html.Div([
     html.Div(id='page-content')
 ])
 
+# Dashboard figures are built once here with placeholder values; the interval
+# callbacks only send Patch updates of the bar heights and colours
+SYSTEM_METRICS = ["CPU Usage", "Memory Usage", "Disk Usage", "Network Load"]
+
+# Usage bar colours: blue below 70%, orange below 90%, red from 90% up
+_COLOR_EDGES = np.array([70.0, 90.0])
+_COLOR_TABLE = np.array(['blue', 'orange', 'red'])
+
+def usage_colors(usage):
+    """Map usage percentages to bar colours in one vectorized lookup"""
+    return _COLOR_TABLE[np.searchsorted(_COLOR_EDGES, usage, side='right')].tolist()
+
+resources_figure = go.Figure()
+resources_figure.add_trace(go.Bar(
+    x=list(RESOURCE_NAMES),
+    y=[0] * len(RESOURCE_NAMES),
+    marker_color='rgb(55, 83, 109)',
+    name="Available"
+))
+resources_figure.add_trace(go.Bar(
+    x=list(RESOURCE_NAMES),
+    y=[0] * len(RESOURCE_NAMES),
+    marker_color='rgb(219, 64, 82)',
+    name="Used"
+))
+resources_figure.update_layout(
+    barmode='stack',
+    title="Resource Availability",
+    xaxis_title="Resource",
+    yaxis_title="Units",
+    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+)
+
+# One trace per resource over every user, so updates never add or remove traces
+allocation_figure = go.Figure()
+for res in RESOURCE_NAMES:
+    allocation_figure.add_trace(go.Bar(
+        x=list(USER_NAMES),
+        y=[0] * len(USER_NAMES),
+        name=res
+    ))
+allocation_figure.update_layout(
+    barmode='group',
+    title="No resources currently allocated",
+    xaxis_title="User",
+    yaxis_title="Allocated Units",
+    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+)
+
+system_usage_figure = go.Figure()
+system_usage_figure.add_trace(go.Bar(
+    x=SYSTEM_METRICS,
+    y=[0] * len(SYSTEM_METRICS),
+    marker_color=['blue'] * len(SYSTEM_METRICS),
+))
+system_usage_figure.update_layout(
+    title="System Resource Usage (%)",
+    xaxis_title="Resource",
+    yaxis_title="Usage (%)",
+    yaxis=dict(range=[0, 100])
+)
+
+# Per-resource usage chart for the standalone web app, patched the same way
+resource_usage_figure = go.Figure()
+resource_usage_figure.add_trace(go.Bar(
+    x=list(RESOURCE_NAMES),
+    y=[0] * len(RESOURCE_NAMES),
+    marker_color=['blue'] * len(RESOURCE_NAMES),
+))
+resource_usage_figure.update_layout(
+    title="System Resource Usage (%)",
+    xaxis_title="Resource",
+    yaxis_title="Usage (%)",
+    yaxis=dict(range=[0, 100])
+)
+
 # Define the dashboard layout
 dashboard_layout = html.Div([
     html.Div([
@@ -334,8 +869,8 @@ dashboard_layout = html.Div([
             html.Button('Logout', id='logout-button', style={'marginLeft': '20px'})
         ], style={'textAlign': 'right', 'padding': '10px'}),
         
-        dcc.Tabs([
-            dcc.Tab(label='Resource Management', children=[
+        dcc.Tabs(id='dashboard-tabs', value='resources', children=[
+            dcc.Tab(label='Resource Management', value='resources', children=[
                 html.Div([
                     html.Div([
                         html.H3("Request/Release Resources"),
@@ -343,7 +878,7 @@ dashboard_layout = html.Div([
                             html.Label("Select Resource:"),
                             dcc.Dropdown(
                                 id='resource-dropdown',
-                                options=[{'label': res, 'value': res} for res in resources.keys()],
+                                options=RESOURCE_OPTIONS,
                                 value='CPU'
                             ),
                             html.Div([
@@ -362,7 +897,7 @@ dashboard_layout = html.Div([
                             html.Label("Select Resource:"),
                             dcc.Dropdown(
                                 id='max-claim-resource',
-                                options=[{'label': res, 'value': res} for res in resources.keys()],
+                                options=RESOURCE_OPTIONS,
                                 value='CPU'
                             ),
                             html.Label("New Max Claim Value:", style={'marginTop': '10px'}),
@@ -380,22 +915,22 @@ dashboard_layout = html.Div([
                 ], style={'marginBottom': '20px'})
             ]),
             
-            dcc.Tab(label='System Monitor', children=[
+            dcc.Tab(label='System Monitor', value='monitor', children=[
                 html.Div([
                     html.Div([
                         html.H3("Available Resources", style={'textAlign': 'center'}),
-                        dcc.Graph(id="resources-graph"),
+                        dcc.Graph(id="resources-graph", figure=resources_figure),
                     ], className='six columns'),
                     
                     html.Div([
                         html.H3("Resource Allocation by User", style={'textAlign': 'center'}),
-                        dcc.Graph(id="allocation-graph"),
+                        dcc.Graph(id="allocation-graph", figure=allocation_figure),
                     ], className='six columns'),
                 ], className='row'),
                 
                 html.Div([
                     html.H3("System Resource Usage", style={'textAlign': 'center'}),
-                    dcc.Graph(id="system-usage-graph"),
+                    dcc.Graph(id="system-usage-graph", figure=system_usage_figure),
                 ]),
                 
                 html.Div([
@@ -410,12 +945,12 @@ dashboard_layout = html.Div([
                 ]),
             ]),
             
-            dcc.Tab(label='System Logs', children=[
+            dcc.Tab(label='System Logs', value='logs', children=[
                 html.Div([
                     html.H3("System Activity Logs", style={'textAlign': 'center'}),
                     html.Button('Clear Logs', id='clear-logs-button', 
                                style={'marginBottom': '10px', 'backgroundColor': '#f44336', 'color': 'white'}),
-                    html.Div(id="logs-container", style={
+                    html.Div(id="dashboard-logs-container", style={
                         'height': '400px',
                         'overflowY': 'scroll',
                         'border': '1px solid #ddd',
@@ -427,7 +962,14 @@ dashboard_layout = html.Div([
             ]),
         ]),
         
-        dcc.Interval(id="interval-update", interval=2000, n_intervals=0)
+        dcc.Interval(id="interval-update", interval=2000, n_intervals=0),
+        # Logs are plain text that nobody reads at 2 s granularity, so they poll on their own slower tick
+        dcc.Interval(id="logs-tick", interval=10000, n_intervals=0),
+        # Keys of the state last rendered by each interval callback in this browser tab
+        dcc.Store(id="resources-render-key"),
+        dcc.Store(id="allocation-render-key"),
+        dcc.Store(id="safety-render-key"),
+        dcc.Store(id="logs-render-key")
     ], style={'padding': '20px', 'maxWidth': '1200px', 'margin': '0 auto'})
 ])
 
@@ -533,12 +1075,10 @@ def update_user_display(n):
     prevent_initial_call=True
 )
 def handle_resource_action(request_clicks, release_clicks, resource):
-    ctx = dash.callback_context
-    if not ctx.triggered:
+    button_id = dash.callback_context.triggered_id
+    if button_id is None:
         return "", {'padding': '10px', 'border': '1px solid #ddd'}
     
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
     if 'user' not in session:
         return "Please log in first", {'padding': '10px', 'border': '1px solid #ddd', 'color': 'red'}
     
@@ -601,11 +1141,11 @@ def update_user_allocations(n):
     user = session['user']
     allocation_rows = []
     
-    for res in resources:
+    for res in RESOURCE_NAMES:
         allocation_rows.append(html.Tr([
             html.Td(res),
-            html.Td(f"{allocation[user][res]:.2f}"),
-            html.Td(f"{max_claim[user][res]:.2f}"),
+            html.Td(f"{to_display(res, allocation[user][res]):.2f}"),
+            html.Td(f"{to_display(res, max_claim[user][res]):.2f}"),
             html.Td(f"{(allocation[user][res] / max_claim[user][res] * 100):.1f}%" if max_claim[user][res] > 0 else "0%")
         ]))
     
@@ -623,127 +1163,42 @@ def update_user_allocations(n):
     
     return table
 
+# The logs tab has no graphs to keep fresh, so poll less often while it is shown
+app.clientside_callback(
+    "function(tab) { return tab === 'logs' ? 5000 : 2000; }",
+    Output("interval-update", "interval"),
+    [Input("dashboard-tabs", "value")]
+)
+
+# Each interval callback compares a render key against the one stored for this
+# browser tab and returns dash.no_update when nothing it shows has changed
 @app.callback(
     [Output("resources-graph", "figure"),
-     Output("allocation-graph", "figure"),
-     Output("system-usage-graph", "figure"),
+     Output("resources-render-key", "data"),
      Output("safety-status", "children"),
-     Output("logs-container", "children")],
-    [Input("interval-update", "n_intervals")]
+     Output("safety-render-key", "data")],
+    [Input("interval-update", "n_intervals")],
+    [State("resources-render-key", "data"),
+     State("safety-render-key", "data")]
 )
-def update_graphs(n):
-    # Update system resources
-    update_system_resources()
-    
-    # Resources graph
-    resource_data = []
-    for res in resources:
-        resource_data.append({"Resource": res, "Available": resources[res]})
-    
-    df_resources = pd.DataFrame(resource_data)
-    
-    fig_resources = go.Figure()
-    fig_resources.add_trace(go.Bar(
-        x=df_resources["Resource"],
-        y=df_resources["Available"],
-        marker_color='rgb(55, 83, 109)',
-        name="Available"
-    ))
-    
-    # Calculate total allocated for each resource
-    for res in resources:
-        total_allocated = sum(allocation[user][res] for user in users)
-        df_resources.loc[df_resources["Resource"] == res, "Total"] = total_allocated + resources[res]
+def update_resources_and_safety(n, last_resources_key, last_safety_key):
+    # Both views are driven by the same resources snapshot, so render them together
+    available = resources
     
-    fig_resources.add_trace(go.Bar(
-        x=df_resources["Resource"],
-        y=df_resources["Total"] - df_resources["Available"],
-        marker_color='rgb(219, 64, 82)',
-        name="Used"
-    ))
-    
-    fig_resources.update_layout(
-        barmode='stack',
-        title="Resource Availability",
-        xaxis_title="Resource",
-        yaxis_title="Units",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-    )
-    
-    # Allocation by user graph
-    user_data = []
-    for user in users:
-        for res in resources:
-            if allocation[user][res] > 0:
-                user_data.append({
-                    "User": user,
-                    "Resource": res,
-                    "Allocated": allocation[user][res]
-                })
-    
-    df_allocation = pd.DataFrame(user_data) if user_data else pd.DataFrame(columns=["User", "Resource", "Allocated"])
-    
-    fig_allocation = go.Figure()
-    if not df_allocation.empty:
-        for res in resources:
-            df_res = df_allocation[df_allocation["Resource"] == res]
-            if not df_res.empty:
-                fig_allocation.add_trace(go.Bar(
-                    x=df_res["User"],
-                    y=df_res["Allocated"],
-                    name=res
-                ))
-        
-        fig_allocation.update_layout(
-            barmode='group',
-            title="Resource Allocation by User",
-            xaxis_title="User",
-            yaxis_title="Allocated Units",
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+    resources_key = [_state_version, [available[res] for res in RESOURCE_NAMES]]
+    if resources_key == last_resources_key:
+        figure, resources_key = dash.no_update, dash.no_update
     else:
-        fig_allocation.update_layout(
-            title="No resources currently allocated",
-            xaxis_title="User",
-            yaxis_title="Allocated Units"
-        )
-    
-    # System Usage Graph
-    system_data = []
-    # CPU usage
-    cpu_percent = psutil.cpu_percent()
-    system_data.append({"Metric": "CPU Usage", "Value": cpu_percent})
-    
-    # Memory usage
-    memory = psutil.virtual_memory()
-    system_data.append({"Metric": "Memory Usage", "Value": memory.percent})
-    
-    # Disk usage
-    disk = psutil.disk_usage('/')
-    system_data.append({"Metric": "Disk Usage", "Value": disk.percent})
-    
-    # Network usage (simplified)
-    system_data.append({"Metric": "Network Load", "Value": (100 - resources["Network"]) if "Network" in resources else 50})
-    
-    df_system = pd.DataFrame(system_data)
-    
-    fig_system = go.Figure()
-    fig_system.add_trace(go.Bar(
-        x=df_system["Metric"],
-        y=df_system["Value"],
-        marker_color=['blue' if x < 70 else 'orange' if x < 90 else 'red' for x in df_system["Value"]],
-    ))
-    
-    fig_system.update_layout(
-        title="System Resource Usage (%)",
-        xaxis_title="Resource",
-        yaxis_title="Usage (%)",
-        yaxis=dict(range=[0, 100])
-    )
+        figure = Patch()
+        figure["data"][0]["y"] = [to_display(res, available[res]) for res in RESOURCE_NAMES]
+        figure["data"][1]["y"] = [to_display(res, total_allocated[res]) for res in RESOURCE_NAMES]
     
     # Banker's Algorithm Safety Status
     is_safe, safe_sequence = is_safe_state()
-    if is_safe:
+    safety_key = [is_safe, safe_sequence]
+    if safety_key == last_safety_key:
+        safety_status, safety_key = dash.no_update, dash.no_update
+    elif is_safe:
         safety_status = [
             html.Div("✅ System is in a SAFE state", style={'color': 'green', 'fontWeight': 'bold'}),
             html.Div(f"Safe Sequence: {' → '.join(safe_sequence)}")
@@ -753,342 +1208,446 @@ def update_graphs(n):
             html.Div("⚠️ System is in an UNSAFE state", style={'color': 'red', 'fontWeight': 'bold'}),
             html.Div("Warning: Potential deadlock condition! Consider releasing resources.")
         ]
+    return figure, resources_key, safety_status, safety_key
+
+@app.callback(
+    [Output("allocation-graph", "figure"),
+     Output("allocation-render-key", "data")],
+    [Input("interval-update", "n_intervals")],
+    [State("allocation-render-key", "data")]
+)
+def update_allocation_graph(n, last_render_key):
+    if _state_version == last_render_key:
+        return dash.no_update, dash.no_update
     
-    # System logs
-    log_items = [html.P(log) for log in logs[-10:]]
+    # Read the cached (users x resources) array rather than walking the nested dicts
+    with mutex:
+        render_key = _state_version
+        alloc_arr, _, _ = get_state_arrays()
+    shown = alloc_arr / _SCALE_ARR
     
-    return fig_resources, fig_allocation, fig_system, safety_status, log_items
+    patch = Patch()
+    for i in range(len(RESOURCE_NAMES)):
+        patch["data"][i]["y"] = shown[:, i].tolist()
+    patch["layout"]["title"]["text"] = "Resource Allocation by User" if alloc_arr.any() else "No resources currently allocated"
+    return patch, render_key
 
-# Function to start the dashboard in a separate thread
-def start_dashboard():
-    global dashboard_server_running
-    if not dashboard_server_running:
-        dashboard_server_running = True
-        # Open browser after a short delay to ensure the server is running
-        threading.Timer(1.5, lambda: webbrowser.open_new("http://127.0.0.1:8050")).start()
-        app.run_server(debug=False, use_reloader=False, port=8050)
+@app.callback(
+    Output("system-usage-graph", "figure"),
+    [Input("interval-update", "n_intervals")]
+)
+def update_system_usage_graph(n):
+    # Every value comes from one published probe, so the bars always describe the same sample
+    sample = system_usage
+    usage = [sample[res] for res in RESOURCE_NAMES]
+    
+    patch = Patch()
+    patch["data"][0]["y"] = usage
+    patch["data"][0]["marker"]["color"] = usage_colors(usage)
+    return patch
+
+@app.callback(
+    [Output("dashboard-logs-container", "children"),
+     Output("logs-render-key", "data")],
+    [Input("logs-tick", "n_intervals")],
+    [State("logs-render-key", "data")]
+)
+def update_dashboard_logs(n, last_render_key):
+    render_key = _log_seq
+    if render_key == last_render_key:
+        return dash.no_update, dash.no_update
+    
+    # System logs
+    log_text = html.Pre("\n".join(recent_logs(10)), style={"whiteSpace": "pre-wrap", "margin": 0})
+    return log_text, render_key
 
 # Define on_close function that was missing in the original code
 def on_close(root):
-    save_state()
+    flush_now()
     root.destroy()
 
 # -------------------- WEB-BASED GUI --------------------
 
-def start_web_app():
-    global dashboard_server_running
-    if not dashboard_server_running:
-        dashboard_server_running = True
-        # Open browser after a short delay to ensure the server is running
-        threading.Timer(1.5, lambda: webbrowser.open_new("http://127.0.0.1:8050")).start()
-        
-        # Create the Dash app
-        app.layout = html.Div([
-            html.H1("Cloud Resource Manager with Real-time Monitoring", className="app-header"),
-            
-            # Login Section
-            html.Div([
-                html.H2("Login"),
-                html.Div([
-                    html.Label("Username:"),
-                    dcc.Input(id="username-input", type="text", placeholder="Enter username"),
-                    html.Br(),
-                    html.Label("Password:"),
-                    dcc.Input(id="password-input", type="password", placeholder="Enter password"),
-                    html.Br(),
-                    html.Button("Login", id="login-button", n_clicks=0),
-                    html.Div(id="login-status")
-                ], id="login-container")
-            ], id="login-section"),
-            
-            # Resource Management Section
-            html.Div([
-                html.H2("Resource Management"),
-                html.Div([
-                    html.Label("Current User:"),
-                    html.Div(id="current-user", style={"fontWeight": "bold"}),
-                    html.Br(),
-                    html.Label("Select Resource:"),
-                    dcc.Dropdown(
-                        id="resource-dropdown",
-                        options=[{"label": res, "value": res} for res in resources.keys()],
-                        value="CPU"
-                    ),
-                    html.Br(),
-                    html.Button("Request Resource", id="request-button", n_clicks=0),
-                    html.Button("Release Resource", id="release-button", n_clicks=0, style={"marginLeft": "10px"}),
-                    html.Div(id="resource-status", style={"marginTop": "10px"})
-                ]),
-                
-                # System Monitor
-                html.Div([
-                    html.H3("System Monitor"),
-                    dcc.Graph(id="system-usage-graph"),
-                    html.Div(id="system-info")
-                ]),
-                
-                # Banker's Algorithm Status
-                html.Div([
-                    html.H3("Banker's Algorithm Status"),
-                    html.Div(id="safety-status"),
-                    html.Div(id="safe-sequence")
-                ]),
-                
-                # User Allocations
-                html.Div([
-                    html.H3("Your Allocations"),
-                    html.Div(id="user-allocations")
-                ]),
-                
-                # Max Claim Management
-                html.Div([
-                    html.H3("Max Claim Management"),
-                    html.Label("Resource:"),
-                    dcc.Dropdown(
-                        id="max-claim-resource",
-                        options=[{"label": res, "value": res} for res in resources.keys()],
-                        value="CPU"
-                    ),
-                    html.Label("New Max:"),
-                    dcc.Input(id="max-claim-value", type="number", min=0, step=0.1),
-                    html.Button("Update Max Claim", id="update-max-claim-button", n_clicks=0),
-                    html.Div(id="max-claim-status")
-                ]),
-                
-                # Refresh Button
-                html.Button("Refresh Data", id="refresh-button", n_clicks=0, style={"marginTop": "20px"})
-            ], id="resource-section", style={"display": "none"}),
-            
-            # System Logs Section
-            html.Div([
-                html.H2("System Logs"),
-                html.Button("Clear Logs", id="clear-logs-button", n_clicks=0),
-                html.Div(id="logs-container", style={"maxHeight": "400px", "overflowY": "auto", "border": "1px solid #ddd", "padding": "10px", "marginTop": "10px"})
-            ]),
-            
-            # Store the current user
-            dcc.Store(id="user-store"),
-            
-            # Interval for periodic updates
-            dcc.Interval(id="interval-component", interval=2000, n_intervals=0)  # Update every 2 seconds
-        ])
-        
-        # Callbacks
-        
-        # Login callback
-        @app.callback(
-            [Output("login-status", "children"),
-             Output("user-store", "data"),
-             Output("login-section", "style"),
-             Output("resource-section", "style")],
-            [Input("login-button", "n_clicks")],
-            [State("username-input", "value"),
-             State("password-input", "value")]
-        )
-        def authenticate(n_clicks, username, password):
-            if n_clicks == 0:
-                return "", None, {"display": "block"}, {"display": "none"}
-            
-            if username in users and users[username] == password:
-                log_event(f"User {username} logged in")
-                return html.Div(f"Logged in as {username}", style={"color": "green"}), username, {"display": "none"}, {"display": "block"}
-            else:
-                return html.Div("Invalid username or password!", style={"color": "red"}), None, {"display": "block"}, {"display": "none"}
+DEFAULT_REFRESH_MS = 5000  # Period of interval-component unless the URL asks for another
+MIN_REFRESH_MS = 1000  # Faster ?interval= values are ignored
+
+# The web GUI is the page that is actually served; it replaces the routed layout above
+app.layout = html.Div([
+    html.H1("Cloud Resource Manager with Real-time Monitoring", className="app-header"),
+    
+    # Login Section
+    html.Div([
+        html.H2("Login"),
+        html.Div([
+            html.Label("Username:"),
+            dcc.Input(id="username-input", type="text", placeholder="Enter username"),
+            html.Br(),
+            html.Label("Password:"),
+            dcc.Input(id="password-input", type="password", placeholder="Enter password"),
+            html.Br(),
+            html.Button("Login", id="login-button", n_clicks=0),
+            html.Div(id="login-status")
+        ], id="login-container")
+    ], id="login-section"),
+    
+    # Resource Management Section
+    html.Div([
+        html.H2("Resource Management"),
+        html.Div([
+            html.Label("Current User:"),
+            html.Div(id="current-user", style={"fontWeight": "bold"}),
+            html.Br(),
+            html.Label("Select Resource:"),
+            dcc.Dropdown(
+                id="resource-dropdown",
+                options=RESOURCE_OPTIONS,
+                value="CPU"
+            ),
+            html.Br(),
+            html.Button("Request Resource", id="request-button", n_clicks=0),
+            html.Button("Release Resource", id="release-button", n_clicks=0, style={"marginLeft": "10px"}),
+            html.Div(id="resource-status", style={"marginTop": "10px"})
+        ]),
         
-        # Display current user
-        @app.callback(
-            Output("current-user", "children"),
-            [Input("user-store", "data")]
-        )
-        def update_current_user(user):
-            return user if user else "Not logged in"
+        # System Monitor
+        html.Div([
+            html.H3("System Monitor"),
+            dcc.Graph(id="system-usage-graph", figure=resource_usage_figure),
+            html.Div(id="system-info")
+        ]),
         
-        # Request resource callback
-        @app.callback(
-            Output("resource-status", "children"),
-            [Input("request-button", "n_clicks"),
-             Input("release-button", "n_clicks")],
-            [State("user-store", "data"),
-             State("resource-dropdown", "value")]
-        )
-        def handle_resource_actions(request_clicks, release_clicks, user, resource):
-            ctx = dash.callback_context
-            if not ctx.triggered:
-                return ""
-            
-            button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-            
-            if not user:
-                return html.Div("Please login first!", style={"color": "red"})
-            
-            if button_id == "request-button" and request_clicks > 0:
-                if request_resource(user, resource):
-                    return html.Div(f"Successfully allocated {resource} to {user}", style={"color": "green"})
-                else:
-                    return html.Div(f"Failed to allocate {resource} to {user}", style={"color": "red"})
-            
-            elif button_id == "release-button" and release_clicks > 0:
-                if release_resource(user, resource):
-                    return html.Div(f"Successfully released {resource} from {user}", style={"color": "green"})
-                else:
-                    return html.Div(f"Failed to release {resource} from {user}", style={"color": "red"})
-            
-            return ""
+        # Banker's Algorithm Status
+        html.Div([
+            html.H3("Banker's Algorithm Status"),
+            html.Div(id="safety-status"),
+            html.Div(id="safe-sequence")
+        ]),
         
-        # Update system info
-        @app.callback(
-            [Output("system-info", "children"),
-             Output("system-usage-graph", "figure"),
-             Output("safety-status", "children"),
-             Output("safe-sequence", "children")],
-            [Input("interval-component", "n_intervals"),
-             Input("refresh-button", "n_clicks")]
-        )
-        def update_system_info(n_intervals, n_clicks):
-            # Update system resources
-            update_system_resources()
-            
-            # System info
-            system_info = [
-                html.Div(f"CPU: {resources['CPU']:.2f} units available"),
-                html.Div(f"Memory: {resources['Memory']:.2f} GB available"),
-                html.Div(f"Disk: {resources['Disk']:.2f} GB available"),
-                html.Div(f"Network: {resources['Network']:.2f} units available")
-            ]
-            
-            # System usage graph
-            system_data = []
-            for res, value in resources.items():
-                # Convert available resources to usage percentage
-                if res == "CPU":
-                    cpu_count = psutil.cpu_count(logical=True)
-                    usage_percent = 100 - (resources[res] / cpu_count * 100)
-                    system_data.append({"Resource": res, "Usage": min(100, max(0, usage_percent))})
-                elif res == "Memory":
-                    total_memory = psutil.virtual_memory().total / (1024 ** 3)
-                    usage_percent = 100 - (resources[res] / total_memory * 100)
-                    system_data.append({"Resource": res, "Usage": min(100, max(0, usage_percent))})
-                elif res == "Disk":
-                    total_disk = psutil.disk_usage('/').total / (1024 ** 3)
-                    usage_percent = 100 - (resources[res] / total_disk * 100)
-                    system_data.append({"Resource": res, "Usage": min(100, max(0, usage_percent))})
-                else:
-                    # For Network, just use a placeholder
-                    system_data.append({"Resource": res, "Usage": 100 - resources[res]})
-            
-            df_system = pd.DataFrame(system_data)
-            
-            fig_system = go.Figure()
-            fig_system.add_trace(go.Bar(
-                x=df_system["Resource"],
-                y=df_system["Usage"],
-                marker_color=['blue' if x < 70 else 'orange' if x < 90 else 'red' for x in df_system["Usage"]],
-            ))
-            
-            fig_system.update_layout(
-                title="System Resource Usage (%)",
-                xaxis_title="Resource",
-                yaxis_title="Usage (%)",
-                yaxis=dict(range=[0, 100])
-            )
-            
-            # Banker's Algorithm Safety Status
-            is_safe, safe_sequence = is_safe_state()
-            if is_safe:
-                safety_status = [
-                    html.Div("✅ System is in a SAFE state", style={'color': 'green', 'fontWeight': 'bold'})
-                ]
-                safe_sequence_text = html.Div(f"Safe Sequence: {' → '.join(safe_sequence)}")
-            else:
-                safety_status = [
-                    html.Div("⚠️ System is in an UNSAFE state", style={'color': 'red', 'fontWeight': 'bold'})
-                ]
-                safe_sequence_text = html.Div("Warning: Potential deadlock condition! Consider releasing resources.")
-            
-            return system_info, fig_system, safety_status, safe_sequence_text
+        # User Allocations
+        html.Div([
+            html.H3("Your Allocations"),
+            html.Div(id="user-allocations")
+        ]),
         
-        # Update user allocations
-        @app.callback(
-            Output("user-allocations", "children"),
-            [Input("interval-component", "n_intervals"),
-             Input("refresh-button", "n_clicks"),
-             Input("resource-status", "children")],
-            [State("user-store", "data")]
-        )
-        def update_user_allocations(n_intervals, n_clicks, resource_status, user):
-            if not user:
-                return "Please login to view your allocations"
-            
-            alloc_items = []
-            for res in resources:
-                alloc_items.append(
-                    html.Div(f"{res}: {allocation[user][res]:.2f} / {max_claim[user][res]:.2f} (used/max)")
-                )
-            
-            return alloc_items
+        # Max Claim Management
+        html.Div([
+            html.H3("Max Claim Management"),
+            html.Label("Resource:"),
+            dcc.Dropdown(
+                id="max-claim-resource",
+                options=RESOURCE_OPTIONS,
+                value="CPU"
+            ),
+            html.Label("New Max:"),
+            dcc.Input(id="max-claim-value", type="number", min=0, step=0.1),
+            html.Button("Update Max Claim", id="update-max-claim-button", n_clicks=0),
+            html.Div(id="max-claim-status")
+        ]),
         
-        # Update max claim
-        @app.callback(
-            Output("max-claim-status", "children"),
-            [Input("update-max-claim-button", "n_clicks")],
-            [State("user-store", "data"),
-             State("max-claim-resource", "value"),
-             State("max-claim-value", "value")]
-        )
-        def update_max_claim_callback(n_clicks, user, resource, new_max):
-            if n_clicks == 0:
-                return ""
-            
-            if not user:
-                return html.Div("Please login first!", style={"color": "red"})
-            
-            if not resource:
-                return html.Div("Please select a resource!", style={"color": "red"})
-            
-            if new_max is None:
-                return html.Div("Please enter a valid value!", style={"color": "red"})
-            
-            try:
-                if new_max < 0:
-                    return html.Div("Max claim must be a positive number", style={"color": "red"})
-                
-                if update_max_claim(user, resource, new_max):
-                    return html.Div(f"Maximum claim for {resource} updated to {new_max}", style={"color": "green"})
-                else:
-                    return html.Div("Failed to update max claim", style={"color": "red"})
-            except Exception as e:
-                return html.Div(f"Error: {str(e)}", style={"color": "red"})
+        # Refresh Button
+        html.Button("Refresh Data", id="refresh-button", n_clicks=0, style={"marginTop": "20px"})
+    ], id="resource-section", style={"display": "none"}),
+    
+    # System Logs Section
+    html.Div([
+        html.H2("System Logs"),
+        html.Button("Clear Logs", id="clear-logs-button", n_clicks=0),
+        html.Div(id="logs-container", style={"maxHeight": "400px", "overflowY": "auto", "border": "1px solid #ddd", "padding": "10px", "marginTop": "10px"})
+    ]),
+    
+    # Store the current user
+    dcc.Store(id="user-store"),
+    # _log_seq of the log list this browser tab last rendered
+    dcc.Store(id="logs-seen-seq"),
+    # Raw system numbers; the browser formats them into the monitor and safety panels
+    dcc.Store(id="sys-store"),
+    # User and _state_version of the allocations this browser tab last rendered
+    dcc.Store(id="allocations-seen-key"),
+    
+    # Intervals for periodic updates. Each tick runs every callback wired to it for
+    # every open tab, so they are kept as slow as the views can tolerate; the
+    # "Refresh Data" button gives fresh numbers on demand in between.
+    # The main period can be overridden per tab with ?interval=<ms> in the page URL.
+    dcc.Location(id="page-url", refresh=False),
+    dcc.Interval(id="interval-component", interval=DEFAULT_REFRESH_MS, n_intervals=0),  # Update every 5 seconds
+    dcc.Interval(id="web-logs-tick", interval=10000, n_intervals=0)  # Logs only need a 10 second refresh
+])
+
+# Callbacks
+
+# Apply an ?interval=<ms> query parameter, ignoring values below MIN_REFRESH_MS
+app.clientside_callback(
+    """
+    function(search) {
+        const interval = parseInt(new URLSearchParams(search || '').get('interval'), 10);
+        return interval >= %d ? interval : window.dash_clientside.no_update;
+    }
+    """ % MIN_REFRESH_MS,
+    Output("interval-component", "interval"),
+    [Input("page-url", "search")]
+)
+
+# Login callback
+@app.callback(
+    [Output("login-status", "children"),
+     Output("user-store", "data"),
+     Output("login-section", "style"),
+     Output("resource-section", "style")],
+    [Input("login-button", "n_clicks")],
+    [State("username-input", "value"),
+     State("password-input", "value")]
+)
+def authenticate(n_clicks, username, password):
+    if n_clicks == 0:
+        return "", None, {"display": "block"}, {"display": "none"}
+    
+    if username in users and users[username] == password:
+        log_event(f"User {username} logged in")
+        return html.Div(f"Logged in as {username}", style={"color": "green"}), username, {"display": "none"}, {"display": "block"}
+    else:
+        return html.Div("Invalid username or password!", style={"color": "red"}), None, {"display": "block"}, {"display": "none"}
+
+# Display current user
+@app.callback(
+    Output("current-user", "children"),
+    [Input("user-store", "data")]
+)
+def update_current_user(user):
+    return user if user else "Not logged in"
+
+# Request resource callback
+@app.callback(
+    Output("resource-status", "children"),
+    [Input("request-button", "n_clicks"),
+     Input("release-button", "n_clicks")],
+    [State("user-store", "data"),
+     State("resource-dropdown", "value")]
+)
+def handle_resource_actions(request_clicks, release_clicks, user, resource):
+    button_id = dash.callback_context.triggered_id
+    if button_id is None:
+        return ""
+    
+    if not user:
+        return html.Div("Please login first!", style={"color": "red"})
+    
+    if button_id == "request-button" and request_clicks > 0:
+        if request_resource(user, resource):
+            return html.Div(f"Successfully allocated {resource} to {user}", style={"color": "green"})
+        else:
+            return html.Div(f"Failed to allocate {resource} to {user}", style={"color": "red"})
+    
+    elif button_id == "release-button" and release_clicks > 0:
+        if release_resource(user, resource):
+            return html.Div(f"Successfully released {resource} from {user}", style={"color": "green"})
+        else:
+            return html.Div(f"Failed to release {resource} from {user}", style={"color": "red"})
+    
+    return ""
+
+# Update system info. Python only gathers the numbers; the clientside callback
+# below turns them into the info lines, the usage bars and the safety panel.
+@app.callback(
+    Output("sys-store", "data"),
+    [Input("interval-component", "n_intervals"),
+     Input("refresh-button", "n_clicks")],
+    [State("sys-store", "data")]
+)
+def update_system_info(n_intervals, n_clicks, last_data):
+    available = resources
+    
+    # Everything below follows from the resources sample and the state version, so when
+    # neither moved since this tab's last payload there is nothing new to send
+    key = [[available[res] for res in RESOURCE_NAMES], _state_version]
+    if last_data and last_data.get("key") == key:
+        return dash.no_update
+    
+    # System usage graph: convert available resources to usage percentages
+    usage = np.clip(100.0 - _resources_array(available) * _USAGE_SCALE, 0.0, 100.0).tolist()
+    
+    # Banker's Algorithm Safety Status
+    is_safe, safe_sequence = is_safe_state()
+    
+    return {
+        "avail": [to_display(res, available[res]) for res in RESOURCE_NAMES],
+        "usage": usage,
+        "colors": usage_colors(usage),
+        "is_safe": is_safe,
+        "seq": safe_sequence,
+        "key": key
+    }
+
+app.clientside_callback(
+    """
+    function(data, figure) {
+        if (!data) {
+            throw window.dash_clientside.PreventUpdate;
+        }
+        const div = (children, style) => ({
+            namespace: 'dash_html_components', type: 'Div', props: {children: children, style: style}
+        });
+        const labels = [['CPU', 'units'], ['Memory', 'GB'], ['Disk', 'GB'], ['Network', 'units']];
+        const info = labels.map(([name, unit], i) => div(`${name}: ${data.avail[i].toFixed(2)} ${unit} available`));
         
-        # Update logs
-        @app.callback(
-            Output("logs-container", "children"),
-            [Input("interval-component", "n_intervals"),
-             Input("clear-logs-button", "n_clicks")]
-        )
-        def update_logs(n_intervals, n_clicks):
-            # Clear logs if button was clicked
-            if dash.callback_context.triggered_id == "clear-logs-button" and n_clicks > 0:
-                global logs
-                logs = []
-                save_state()
-                return [html.P("Logs cleared")]
-            
-            # Display logs
-            return [html.P(log) for log in logs[-50:]]  # Show last 50 logs
+        const bar = Object.assign({}, figure.data[0], {
+            y: data.usage,
+            marker: Object.assign({}, figure.data[0].marker, {color: data.colors})
+        });
+        const usageFigure = Object.assign({}, figure, {data: [bar]});
         
-        # Start the system monitor in a separate thread
-        monitor_thread = threading.Thread(target=system_monitor, daemon=True)
-        monitor_thread.start()
+        if (data.is_safe) {
+            return [info, usageFigure,
+                    [div('✅ System is in a SAFE state', {color: 'green', fontWeight: 'bold'})],
+                    div('Safe Sequence: ' + data.seq.join(' → '))];
+        }
+        return [info, usageFigure,
+                [div('⚠️ System is in an UNSAFE state', {color: 'red', fontWeight: 'bold'})],
+                div('Warning: Potential deadlock condition! Consider releasing resources.')];
+    }
+    """,
+    [Output("system-info", "children"),
+     Output("system-usage-graph", "figure"),
+     Output("safety-status", "children"),
+     Output("safe-sequence", "children")],
+    [Input("sys-store", "data")],
+    [State("system-usage-graph", "figure")]
+)
+
+# Update user allocations
+@app.callback(
+    [Output("user-allocations", "children"),
+     Output("allocations-seen-key", "data")],
+    [Input("interval-component", "n_intervals"),
+     Input("refresh-button", "n_clicks"),
+     Input("resource-status", "children")],
+    [State("user-store", "data"),
+     State("allocations-seen-key", "data")]
+)
+def update_web_user_allocations(n_intervals, n_clicks, resource_status, user, seen_key):
+    # Allocations and max claims only change with the state version
+    render_key = [user, _state_version if user else None]
+    if render_key == seen_key:
+        return dash.no_update, dash.no_update
+    
+    if not user:
+        return "Please login to view your allocations", render_key
+    
+    # The user's rows of the cached arrays, converted to display units in one step
+    u = USER_IDX[user]
+    with mutex:
+        render_key = [user, _state_version]
+        alloc_arr, max_claim_arr, _ = get_state_arrays()
+    used = (alloc_arr[u] / _SCALE_ARR).tolist()
+    limit = (max_claim_arr[u] / _SCALE_ARR).tolist()
+    
+    alloc_items = [html.Div(f"{res}: {used[k]:.2f} / {limit[k]:.2f} (used/max)")
+                   for k, res in enumerate(RESOURCE_NAMES)]
+    
+    return alloc_items, render_key
+
+# Update max claim
+@app.callback(
+    Output("max-claim-status", "children"),
+    [Input("update-max-claim-button", "n_clicks")],
+    [State("user-store", "data"),
+     State("max-claim-resource", "value"),
+     State("max-claim-value", "value")]
+)
+def update_max_claim_callback(n_clicks, user, resource, new_max):
+    if n_clicks == 0:
+        return ""
+    
+    if not user:
+        return html.Div("Please login first!", style={"color": "red"})
+    
+    if not resource:
+        return html.Div("Please select a resource!", style={"color": "red"})
+    
+    if new_max is None:
+        return html.Div("Please enter a valid value!", style={"color": "red"})
+    
+    try:
+        if new_max < 0:
+            return html.Div("Max claim must be a positive number", style={"color": "red"})
         
-        # Run the app
-        app.run_server(debug=False, use_reloader=False, port=8050)
+        if update_max_claim(user, resource, new_max):
+            return html.Div(f"Maximum claim for {resource} updated to {new_max}", style={"color": "green"})
+        else:
+            return html.Div("Failed to update max claim", style={"color": "red"})
+    except Exception as e:
+        return html.Div(f"Error: {str(e)}", style={"color": "red"})
 
-def main():
+# Update logs
+@app.callback(
+    [Output("logs-container", "children"),
+     Output("logs-seen-seq", "data")],
+    [Input("web-logs-tick", "n_intervals"),
+     Input("clear-logs-button", "n_clicks")],
+    [State("logs-seen-seq", "data")]
+)
+def update_logs(n_intervals, n_clicks, seen_seq):
+    # Clear logs if button was clicked
+    if dash.callback_context.triggered_id == "clear-logs-button" and n_clicks > 0:
+        clear_logs()
+        return [html.P("Logs cleared")], _log_seq
+    
+    # Nothing was logged since this tab last rendered, so send nothing
+    log_seq = _log_seq
+    if log_seq == seen_seq:
+        return dash.no_update, dash.no_update
+    
+    # Display the last 50 logs as one text block rather than one component per line
+    return html.Pre("\n".join(recent_logs(50)), style={"whiteSpace": "pre-wrap", "margin": 0}), log_seq
+
+def init_app():
+    """Take the first resource sample, load state and start the background threads; runs once"""
+    global app_initialized
+    with _startup_lock:
+        if app_initialized:
+            return
+        app_initialized = True
+    
+    # Take the first resource sample synchronously; system_monitor keeps it fresh afterwards
+    update_system_resources()
+    
     # Load previous state
     load_state()
     
-    # Start the web app
-    start_web_app()
+    # Start the system monitor in a separate thread
+    monitor_thread = threading.Thread(target=system_monitor, daemon=True)
+    monitor_thread.start()
+    
+    # Flush dirty state to disk in the background
+    writer_thread = threading.Thread(target=state_writer, daemon=True)
+    writer_thread.start()
+
+def start_web_app():
+    global dashboard_server_running
+    # Only the first caller starts the server; a second bind on port 8050 would fail
+    with _startup_lock:
+        if dashboard_server_running:
+            return
+        dashboard_server_running = True
+    
+    # Open browser after a short delay to ensure the server is running
+    threading.Timer(1.5, lambda: webbrowser.open_new("http://127.0.0.1:8050")).start()
+    
+    # Run the app
+    if uvicorn is not None:
+        uvicorn.run(asgi_app, host="127.0.0.1", port=8050, workers=1)
+    else:
+        app.run_server(debug=False, use_reloader=False, port=8050)
+
+def main():
+    init_app()
+    
+    # Start the web app, flushing any pending state on shutdown. Under uvicorn the
+    # lifespan shutdown already flushes, and a second flush would rotate the backups again
+    try:
+        start_web_app()
+    finally:
+        if asgi_app is None:
+            flush_now()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file